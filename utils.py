@@ -1,4 +1,17 @@
+import asyncio
+import atexit
+import collections
+import contextvars
+import copy
 import json
+import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
@@ -8,6 +21,24 @@ import requests
 from langfuse.decorators import langfuse_context, observe
 from langfuse.model import PromptClient
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+except ImportError:  # orjson is optional; stdlib json works everywhere
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+try:
+    import aioboto3
+    import aiohttp
+except ImportError:  # the async pipeline is optional; sync wrappers work without it
+    aioboto3 = None
+    aiohttp = None
+
 
 # used to invoke the Bedrock Converse API
 bedrock_runtime = boto3.client(
@@ -15,63 +46,372 @@ bedrock_runtime = boto3.client(
     region_name="us-east-1"
 )
 
-# In case the input message is not in the Bedrock Converse API format,
-# for example it follow openAI format, we need to convert it to the Bedrock Converse API format.
-def convert_to_bedrock_messages(
+# Client construction is one of the slowest boto3 operations (it loads the
+# service model), so build the Secrets Manager client once like bedrock_runtime
+_secrets_client = boto3.client(
+    service_name="secretsmanager",
+    region_name="us-east-1"
+)
+
+# Shared HTTP session for image downloads so repeated fetches reuse
+# pooled connections instead of paying a TCP+TLS handshake per image.
+_http = requests.Session()
+_http_adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=20)
+_http.mount("https://", _http_adapter)
+_http.mount("http://", _http_adapter)
+
+# Bounded worker count so a message with many images doesn't hammer the
+# remote host; image fetches are I/O bound so threads overlap well.
+_MAX_DOWNLOAD_WORKERS = 8
+
+
+# Bedrock expects "jpeg"; everything else passes through as-is
+_FORMAT_ALIASES = {"jpg": "jpeg"}
+
+# Captures scheme, netloc and path extension in a single linear pass,
+# replacing the much heavier urlparse call for well-formed image URLs
+_IMG_URL_RE = re.compile(
+    r"^(https?)://([^/\s]+)/(?:[^?#\s]*\.)?([A-Za-z0-9]{1,5})(?:[?#]|$)"
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_image_url(url: str) -> Tuple[str, str, str]:
+    """Validate an image URL and return (scheme, netloc, format).
+
+    Cached so repeated URLs (e.g. the same image across conversation
+    turns) skip the parse entirely; first-time parses use a compiled
+    regex with urlparse kept as the fallback for unusual URLs.
+    """
+    match = _IMG_URL_RE.match(url)
+    if match:
+        scheme, netloc, extension = match.groups()
+    else:
+        parsed_url = urlparse(url)
+        if not parsed_url.scheme or not parsed_url.netloc:
+            raise ValueError("Invalid URL format")
+        scheme, netloc = parsed_url.scheme, parsed_url.netloc
+        extension = parsed_url.path.split(".")[-1]
+    extension = extension.lower()
+    return scheme, netloc, _FORMAT_ALIASES.get(extension, extension)
+
+
+# Below this size the convenience of response.content beats raw streaming
+_SMALL_IMAGE_BYTES = 64 * 1024
+
+# Refuse anything larger than this so a pathological URL can't blow up
+# memory or stall the request
+MAX_IMG_BYTES = 20 * 1024 * 1024
+
+
+@lru_cache(maxsize=256)
+def _download_image(url: str) -> bytes:
+    """Fetch image bytes for a URL, capped at MAX_IMG_BYTES.
+
+    Cached so an image replayed across conversation turns or requests
+    (common in agent loops) is only downloaded once.
+    """
+    response = _http.get(url, stream=True, timeout=(3.05, 30))
+    try:
+        response.raise_for_status()
+        content_length = int(response.headers.get("Content-Length", 0))
+        if content_length > MAX_IMG_BYTES:
+            raise ValueError(
+                f"Image at {url} is {content_length} bytes, exceeds the "
+                f"{MAX_IMG_BYTES}-byte limit"
+            )
+        if 0 < content_length < _SMALL_IMAGE_BYTES:
+            return response.content
+        # Read straight off the urllib3 response to avoid buffering the
+        # body twice for large images; read one byte past the cap so an
+        # unannounced oversize body is still caught
+        image_bytes = response.raw.read(MAX_IMG_BYTES + 1, decode_content=True)
+        if len(image_bytes) > MAX_IMG_BYTES:
+            raise ValueError(
+                f"Image at {url} exceeds the {MAX_IMG_BYTES}-byte limit"
+            )
+        return image_bytes
+    finally:
+        response.close()
+
+
+def _handle_text(content_item, content_list, image_tasks):
+    content_list.append({"text": content_item["text"]})
+
+
+def _handle_image_url(content_item, content_list, image_tasks):
+    # Get image format from URL
+    if "url" not in content_item["image_url"]:
+        raise ValueError("Missing required 'url' field in image_url")
+    url = content_item["image_url"]["url"]
+    if not url:
+        raise ValueError("URL cannot be empty")
+    _, _, image_format = _parse_image_url(url)
+
+    # Reserve the slot; bytes are filled in once all downloads
+    # have been kicked off concurrently.
+    image_tasks.append((content_list, len(content_list), url, image_format))
+    content_list.append(None)
+
+
+# Dispatch table for content-item types; unknown types are skipped
+_CONTENT_HANDLERS = {"text": _handle_text, "image_url": _handle_image_url}
+
+
+def _collect_bedrock_messages(
     messages: List[Dict[str, Any]]
-) -> Tuple[List[Dict[str, str]], List[Dict[str, Any]]]:
-    """Convert message to Bedrock Converse API format"""
+) -> Tuple[List[Dict[str, str]], List[Dict[str, Any]], List[Tuple]]:
+    """Walk messages once, deferring image downloads as tasks.
+
+    Shared by the sync and async converters; each task remembers the
+    content slot its bytes belong to.
+    """
+    # Extract system messages in one pass
+    system_prompts = [
+        {"text": msg["content"]} for msg in messages if msg["role"] == "system"
+    ]
+
     bedrock_messages = []
+    image_tasks = []  # (content_list, index, url, format)
 
-    # Extract system messages first
-    system_prompts = []
+    # Handle user/assistant messages
     for msg in messages:
         if msg["role"] == "system":
-            system_prompts.append({"text": msg["content"]})
-        else:
-            # Handle user/assistant messages
+            continue
+
+        # If content is already a list, process each item; else it's plain text
+        if isinstance(msg["content"], list):
             content_list = []
+            for content_item in msg["content"]:
+                handler = _CONTENT_HANDLERS.get(content_item["type"])
+                if handler:
+                    handler(content_item, content_list, image_tasks)
+        else:
+            content_list = [{"text": msg["content"]}]
+
+        bedrock_messages.append({"role": msg["role"], "content": content_list})
+
+    return system_prompts, bedrock_messages, image_tasks
+
+
+def _stitch_image(image_task: Tuple, image_bytes: bytes) -> None:
+    content_list, index, _, image_format = image_task
+    content_list[index] = {
+        "image": {
+            "format": image_format,
+            "source": {"bytes": image_bytes},
+        }
+    }
 
-            # If content is already a list, process each item
-            if isinstance(msg["content"], list):
-                for content_item in msg["content"]:
-                    if content_item["type"] == "text":
-                        content_list.append({"text": content_item["text"]})
-                    elif content_item["type"] == "image_url":
-                        # Get image format from URL
-                        if "url" not in content_item["image_url"]:
-                            raise ValueError("Missing required 'url' field in image_url")
-                        url = content_item["image_url"]["url"]
-                        if not url:
-                            raise ValueError("URL cannot be empty")
-                        parsed_url = urlparse(url)
-                        if not parsed_url.scheme or not parsed_url.netloc:
-                            raise ValueError("Invalid URL format")
-                        image_format = parsed_url.path.split(".")[-1].lower()
-                        # Convert jpg to jpeg for Bedrock compatibility
-                        if image_format == "jpg":
-                            image_format = "jpeg"
-
-                        # Download and encode image
-                        response = requests.get(url)
-                        image_bytes = response.content
-
-                        content_list.append(
-                            {
-                                "image": {
-                                    "format": image_format,
-                                    "source": {"bytes": image_bytes},
-                                }
-                            }
-                        )
-            else:
-                # If content is just text
-                content_list.append({"text": msg["content"]})
-
-            bedrock_messages.append({"role": msg["role"], "content": content_list})
+
+# In case the input message is not in the Bedrock Converse API format,
+# for example it follow openAI format, we need to convert it to the Bedrock Converse API format.
+def convert_to_bedrock_messages(
+    messages: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, str]], List[Dict[str, Any]]]:
+    """Convert message to Bedrock Converse API format"""
+    system_prompts, bedrock_messages, image_tasks = _collect_bedrock_messages(messages)
+
+    # Fetch unique images concurrently and stitch the bytes back into place;
+    # duplicated URLs within the batch are only downloaded once
+    if image_tasks:
+        unique_urls = list({url for _, _, url, _ in image_tasks})
+        with ThreadPoolExecutor(max_workers=_MAX_DOWNLOAD_WORKERS) as executor:
+            bytes_by_url = dict(
+                zip(unique_urls, executor.map(_download_image, unique_urls))
+            )
+        for task in image_tasks:
+            _stitch_image(task, bytes_by_url[task[2]])
 
     return system_prompts, bedrock_messages
 
+
+def _langfuse_enabled() -> bool:
+    """Whether Langfuse keys are configured.
+
+    Checked at call time (not import) because the labs may set the keys
+    after importing this module; when disabled, observation updates are
+    skipped so tracing adds no serialization overhead.
+    """
+    return bool(os.environ.get("LANGFUSE_PUBLIC_KEY"))
+
+
+# Request-side observation updates are buffered here and applied by a
+# background thread (Apiary-style async export). Each entry carries a
+# contextvars snapshot so the update still targets the observation that
+# was current when it was enqueued. Only updates made well before the
+# wrapper returns may be queued: the @observe decorator finalizes the
+# observation synchronously at return, so anything applied later is lost.
+_obs_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+_OBS_BATCH_SIZE = 32
+_OBS_FLUSH_INTERVAL = 0.05  # seconds
+
+
+def _apply_observation_update(ctx: contextvars.Context, payload: Dict[str, Any]) -> None:
+    try:
+        ctx.run(langfuse_context.update_current_observation, **payload)
+    except Exception as e:  # tracing must never take down the request path
+        print(f"WARNING: dropped Langfuse observation update: {e}")
+
+
+def _drain_obs_queue(block: bool) -> None:
+    for _ in range(_OBS_BATCH_SIZE):
+        try:
+            item = _obs_queue.get(block=block, timeout=_OBS_FLUSH_INTERVAL)
+        except queue.Empty:
+            return
+        _apply_observation_update(*item)
+        block = False
+
+
+def _obs_worker() -> None:
+    while True:
+        _drain_obs_queue(block=True)
+
+
+_obs_thread = threading.Thread(
+    target=_obs_worker, name="langfuse-obs-flush", daemon=True
+)
+_obs_thread.start()
+
+
+def _flush_obs() -> None:
+    """Apply any still-queued observation updates (e.g. at shutdown)."""
+    while True:
+        try:
+            item = _obs_queue.get_nowait()
+        except queue.Empty:
+            return
+        _apply_observation_update(*item)
+
+
+atexit.register(_flush_obs)
+
+
+def _update_observation(**payload) -> None:
+    """Apply an observation update immediately.
+
+    Used for output/usage and error updates, which must land before the
+    wrapper returns and the decorator finalizes the observation. This is
+    pure in-memory bookkeeping: Langfuse exports on its own background
+    worker, so there is no network I/O on this path.
+    """
+    if _langfuse_enabled():
+        langfuse_context.update_current_observation(**payload)
+
+
+def _defer_observation(**payload) -> None:
+    """Queue a request-side update for the background flush thread.
+
+    Only safe for updates made at the start of a wrapper, which the flush
+    thread applies while the model call is still in flight.
+    """
+    if _langfuse_enabled():
+        _obs_queue.put_nowait((contextvars.copy_context(), payload))
+
+
+class RateLimiter:
+    """Sliding-window limiter that paces Bedrock calls client-side.
+
+    Waiting here is cheaper than letting the service throttle us and
+    paying boto3's exponential-backoff retries on the tail.
+    """
+
+    def __init__(self, max_requests: int, period: float):
+        self.max_requests = max_requests
+        self.period = period
+        self._timestamps: collections.deque = collections.deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.time()
+            while self._timestamps and self._timestamps[0] < now - self.period:
+                self._timestamps.popleft()
+            if len(self._timestamps) >= self.max_requests:
+                time.sleep(self.period - (now - self._timestamps[0]))
+            self._timestamps.append(time.time())
+
+    async def aacquire(self) -> None:
+        """Async variant; sleeps on the event loop instead of the thread."""
+        with self._lock:
+            now = time.time()
+            while self._timestamps and self._timestamps[0] < now - self.period:
+                self._timestamps.popleft()
+            wait = 0.0
+            if len(self._timestamps) >= self.max_requests:
+                # Pace against the admission that vacates the slot this
+                # call reserves, so queued coroutines are released
+                # max_requests per period instead of all at once
+                slot = self._timestamps[len(self._timestamps) - self.max_requests]
+                wait = max(slot + self.period - now, 0.0)
+            self._timestamps.append(now + wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+_BEDROCK_RL = RateLimiter(max_requests=10, period=1.0)
+
+
+# kwargs entries surfaced to Langfuse as model parameters
+_MODEL_PARAMETER_KEYS = (
+    "inferenceConfig",
+    "additionalModelRequestFields",
+    "guardrailConfig",
+)
+
+
+def _extract_model_parameters(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten config kwargs for Langfuse without copying or mutating kwargs."""
+    model_parameters = {}
+    for key in _MODEL_PARAMETER_KEYS:
+        value = kwargs.get(key)
+        if value:
+            model_parameters.update(value)
+    return model_parameters
+
+
+def _record_request_observation(
+    messages: List[Dict[str, Any]],
+    model_id: str,
+    prompt: Optional[PromptClient],
+    kwargs: Dict[str, Any],
+    extra_input: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Record the request-side observation shared by every wrapper.
+
+    Returns the extracted model parameters; extra_input (e.g. tools) is
+    merged into the observation input alongside the messages.
+    """
+    model_parameters = _extract_model_parameters(kwargs)
+    if extra_input:
+        observation_input: Any = {"messages": messages, **extra_input}
+    else:
+        observation_input = messages
+    _defer_observation(
+        input=observation_input,
+        model=model_id,
+        model_parameters=model_parameters,
+        prompt=prompt,
+    )
+    return model_parameters
+
+
+def _prep_request(
+    messages: List[Dict[str, Any]],
+    model_id: str,
+    prompt: Optional[PromptClient],
+    kwargs: Dict[str, Any],
+    extra_input: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[Dict[str, str]], List[Dict[str, Any]], Dict[str, Any]]:
+    """Shared sync prelude: record the observation and convert messages."""
+    model_parameters = _record_request_observation(
+        messages, model_id, prompt, kwargs, extra_input
+    )
+    system_prompts, bedrock_messages = convert_to_bedrock_messages(messages)
+    return system_prompts, bedrock_messages, model_parameters
+
+
 # region Converse API Wrapper for Chat
 @observe(as_type="generation", name="Bedrock Converse")
 def converse(
@@ -81,25 +421,12 @@ def converse(
     metadata: Dict[str, Any] = {},
     **kwargs,
 ) -> Optional[str]:
-    # 1. extract model metadata
-    kwargs_clone = kwargs.copy()
-    model_parameters = {
-        **kwargs_clone.pop("inferenceConfig", {}),
-        **kwargs_clone.pop("additionalModelRequestFields", {}),
-        **kwargs_clone.pop("guardrailConfig", {}),
-    }
-    langfuse_context.update_current_observation(
-        input=messages,
-        model=model_id,
-        model_parameters=model_parameters,
-        prompt=prompt,
-    )
-
-    # Convert messages to Bedrock format
-    system_prompts, messages = convert_to_bedrock_messages(messages)
+    # 1. extract model metadata and convert messages to Bedrock format
+    system_prompts, messages, _ = _prep_request(messages, model_id, prompt, kwargs)
 
     # 2. model call with error handling
     try:
+        _BEDROCK_RL.acquire()
         response = bedrock_runtime.converse(
             modelId=model_id,
             system=system_prompts,
@@ -108,7 +435,7 @@ def converse(
         )
     except (ClientError, Exception) as e:
         error_message = f"ERROR: Can't invoke '{model_id}'. Reason: {e}"
-        langfuse_context.update_current_observation(
+        _update_observation(
             level="ERROR", status_message=error_message
         )
         print(error_message)
@@ -116,7 +443,7 @@ def converse(
 
     # 3. extract response metadata
     response_text = response["output"]["message"]["content"][0]["text"]
-    langfuse_context.update_current_observation(
+    _update_observation(
         output=response_text,
         usage={
             "input": response["usage"]["inputTokens"],
@@ -133,6 +460,52 @@ def converse(
 # endregion
 
 # region Converse API Wrapper for Tool Use
+_TOOL_CHOICES = {"any": {"any": {}}, "auto": {"auto": {}}}
+
+
+@lru_cache(maxsize=128)
+def _build_tool_config(tool_keys: Tuple[Tuple[str, str, str], ...]) -> Dict[str, Any]:
+    """Build the Bedrock toolConfig for a (hashable) tool spec.
+
+    Cached because tool registries are typically stable across requests,
+    so the nested dict only has to be constructed once per toolset.
+    """
+    return {
+        "tools": [
+            {
+                "toolSpec": {
+                    "name": name,
+                    "description": description,
+                    "inputSchema": {"json": json.loads(parameters)},
+                }
+            }
+            for name, description, parameters in tool_keys
+        ]
+    }
+
+
+def _tool_config_for(tools: List[Dict[str, str]], tool_choice: str) -> Dict[str, Any]:
+    """Build the full toolConfig (cached spec conversion plus toolChoice)."""
+    tool_keys = tuple(
+        (
+            tool["function"]["name"],
+            tool["function"]["description"],
+            json.dumps(tool["function"]["parameters"], sort_keys=True),
+        )
+        for tool in tools
+        if tool["type"] == "function"
+    )
+    # deepcopy so the toolChoice mutation never leaks into the cache
+    tool_config = copy.deepcopy(_build_tool_config(tool_keys))
+
+    # Anything other than "any"/"auto" names a specific tool
+    if tool_choice != "auto":
+        tool_config["toolChoice"] = _TOOL_CHOICES.get(
+            tool_choice, {"tool": {"name": tool_choice}}
+        )
+    return tool_config
+
+
 @observe(as_type="generation", name="Bedrock Converse Tool Use")
 def converse_tool_use(
     messages: List[Dict[str, str]],
@@ -143,51 +516,21 @@ def converse_tool_use(
     metadata: Dict[str, Any] = {},
     **kwargs,
 ) -> Optional[List[Dict]]:
-    # 1. extract model metadata
-    kwargs_clone = kwargs.copy()
-    model_parameters = {
-        **kwargs_clone.pop("inferenceConfig", {}),
-        **kwargs_clone.pop("additionalModelRequestFields", {}),
-        **kwargs_clone.pop("guardrailConfig", {}),
-    }
-
-    langfuse_context.update_current_observation(
-        input={"messages": messages, "tools": tools, "tool_choice": tool_choice},
-        model=model_id,
-        model_parameters=model_parameters,
-        prompt=prompt,
+    # 1. extract model metadata and convert messages to Bedrock format
+    system_prompts, messages, _ = _prep_request(
+        messages,
+        model_id,
+        prompt,
+        kwargs,
+        extra_input={"tools": tools, "tool_choice": tool_choice},
     )
 
-    # Convert messages to Bedrock format
-    system_prompts, messages = convert_to_bedrock_messages(messages)
-
     # 2. Convert tools to Bedrock format
-    tool_config = {
-        "tools": [
-            {
-                "toolSpec": {
-                    "name": tool["function"]["name"],
-                    "description": tool["function"]["description"],
-                    "inputSchema": {"json": tool["function"]["parameters"]},
-                }
-            }
-            for tool in tools
-            if tool["type"] == "function"
-        ]
-    }
-
-    # Add toolChoice configuration based on input
-    if tool_choice != "auto":
-        tool_config["toolChoice"] = {
-            "any": {} if tool_choice == "any" else None,
-            "auto": {} if tool_choice == "auto" else None,
-            "tool": (
-                {"name": tool_choice} if not tool_choice in ["any", "auto"] else None
-            ),
-        }
+    tool_config = _tool_config_for(tools, tool_choice)
 
     # 3. model call with error handling
     try:
+        _BEDROCK_RL.acquire()
         response = bedrock_runtime.converse(
             modelId=model_id,
             system=system_prompts,
@@ -197,7 +540,7 @@ def converse_tool_use(
         )
     except (ClientError, Exception) as e:
         error_message = f"ERROR: Can't invoke '{model_id}'. Reason: {e}"
-        langfuse_context.update_current_observation(
+        _update_observation(
             level="ERROR", status_message=error_message
         )
         print(error_message)
@@ -208,23 +551,26 @@ def converse_tool_use(
 
     tool_calls = []
     if response["stopReason"] == "tool_use":
-        for content in output_message["content"]:
-            if "toolUse" in content:
-                tool = content["toolUse"]
-                tool_calls.append(
-                    {
-                        "index": len(tool_calls),
-                        "id": tool["toolUseId"],
-                        "type": "function",
-                        "function": {
-                            "name": tool["name"],
-                            "arguments": json.dumps(tool["input"]),
-                        },
-                    }
-                )
+        tool_uses = [
+            content["toolUse"]
+            for content in output_message["content"]
+            if "toolUse" in content
+        ]
+        tool_calls = [
+            {
+                "index": index,
+                "id": tool["toolUseId"],
+                "type": "function",
+                "function": {
+                    "name": tool["name"],
+                    "arguments": _json_dumps(tool["input"]),
+                },
+            }
+            for index, tool in enumerate(tool_uses)
+        ]
 
     # 5. Update Langfuse with response metadata
-    langfuse_context.update_current_observation(
+    _update_observation(
         output=tool_calls,
         usage={
             "input": response["usage"]["inputTokens"],
@@ -240,22 +586,254 @@ def converse_tool_use(
     return tool_calls
 # endregion
 
+# region Async Converse Pipeline
+# Lazily-created shared aiohttp session and aioboto3 Bedrock client; the
+# lock makes first-use initialization safe under concurrent coroutines.
+# Both objects are bound to the event loop that created them, so the
+# cache is keyed on the running loop and rebuilt when it changes (e.g. a
+# fresh asyncio.run or a restarted kernel).
+_aio_loop: Optional[asyncio.AbstractEventLoop] = None
+_aio_lock: Optional[asyncio.Lock] = None
+_aio_stack: Optional[AsyncExitStack] = None
+_aio_http = None
+_aio_bedrock = None
+
+
+def _discard_async_clients() -> None:
+    """Drop the cached async clients, closing them on their own loop when possible."""
+    global _aio_stack, _aio_http, _aio_bedrock
+    stack, _aio_stack = _aio_stack, None
+    _aio_http = None
+    _aio_bedrock = None
+    if stack is None or _aio_loop is None:
+        return
+    if _aio_loop.is_running():
+        # another thread still drives the old loop; close there
+        asyncio.run_coroutine_threadsafe(stack.aclose(), _aio_loop)
+        return
+    if _aio_loop.is_closed():
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # no loop running in this thread (e.g. atexit); drive the old one
+        _aio_loop.run_until_complete(stack.aclose())
+    # else: a different loop now runs in this thread, so the old loop can
+    # no longer be driven here; the stack is left for garbage collection
+
 
+atexit.register(_discard_async_clients)
 
-def get_secret():
 
-    secret_name = "LangFuse-LLM-monitoring"
-    region_name = "us-east-1"
+async def _get_async_clients():
+    if aioboto3 is None or aiohttp is None:
+        raise ImportError(
+            "aioboto3 and aiohttp are required for the async converse pipeline"
+        )
+    global _aio_loop, _aio_lock, _aio_stack, _aio_http, _aio_bedrock
+    loop = asyncio.get_running_loop()
+    if loop is not _aio_loop:
+        _discard_async_clients()
+        _aio_loop = loop
+        _aio_lock = asyncio.Lock()
+    async with _aio_lock:
+        if _aio_bedrock is None:
+            _aio_stack = AsyncExitStack()
+            _aio_http = await _aio_stack.enter_async_context(
+                aiohttp.ClientSession()
+            )
+            _aio_bedrock = await _aio_stack.enter_async_context(
+                aioboto3.Session().client(
+                    service_name="bedrock-runtime",
+                    region_name="us-east-1",
+                )
+            )
+    return _aio_http, _aio_bedrock
+
+
+async def _afetch_image(session, url: str) -> bytes:
+    timeout = aiohttp.ClientTimeout(sock_connect=3.05, total=30)
+    async with session.get(url, timeout=timeout) as response:
+        response.raise_for_status()
+        content_length = int(response.headers.get("Content-Length", 0))
+        if content_length > MAX_IMG_BYTES:
+            raise ValueError(
+                f"Image at {url} is {content_length} bytes, exceeds the "
+                f"{MAX_IMG_BYTES}-byte limit"
+            )
+        # StreamReader.read(n) only returns what is already buffered, so
+        # accumulate chunks until EOF while enforcing the cap
+        chunks = []
+        total = 0
+        async for chunk in response.content.iter_chunked(_SMALL_IMAGE_BYTES):
+            total += len(chunk)
+            if total > MAX_IMG_BYTES:
+                raise ValueError(
+                    f"Image at {url} exceeds the {MAX_IMG_BYTES}-byte limit"
+                )
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+
+async def aconvert_to_bedrock_messages(
+    messages: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, str]], List[Dict[str, Any]]]:
+    """Async variant of convert_to_bedrock_messages using aiohttp."""
+    system_prompts, bedrock_messages, image_tasks = _collect_bedrock_messages(messages)
+
+    if image_tasks:
+        session, _ = await _get_async_clients()
+        unique_urls = list({url for _, _, url, _ in image_tasks})
+        all_bytes = await asyncio.gather(
+            *(_afetch_image(session, url) for url in unique_urls)
+        )
+        bytes_by_url = dict(zip(unique_urls, all_bytes))
+        for task in image_tasks:
+            _stitch_image(task, bytes_by_url[task[2]])
+
+    return system_prompts, bedrock_messages
+
+
+@observe(as_type="generation", name="Bedrock Converse")
+async def aconverse(
+    messages: List[Dict[str, Any]],
+    model_id: str = "us.amazon.nova-pro-v1:0",
+    prompt: Optional[PromptClient] = None,
+    metadata: Dict[str, Any] = {},
+    **kwargs,
+) -> Optional[str]:
+    """Async variant of converse; one event loop can drive many conversations."""
+    # 1. extract model metadata
+    _record_request_observation(messages, model_id, prompt, kwargs)
 
-    # Create a Secrets Manager client
-    session = boto3.session.Session()
-    client = session.client(
-        service_name='secretsmanager',
-        region_name=region_name
+    # Convert messages to Bedrock format
+    system_prompts, messages = await aconvert_to_bedrock_messages(messages)
+
+    # 2. model call with error handling
+    try:
+        _, bedrock = await _get_async_clients()
+        await _BEDROCK_RL.aacquire()
+        response = await bedrock.converse(
+            modelId=model_id,
+            system=system_prompts,
+            messages=messages,
+            **kwargs,
+        )
+    except (ClientError, Exception) as e:
+        error_message = f"ERROR: Can't invoke '{model_id}'. Reason: {e}"
+        _update_observation(level="ERROR", status_message=error_message)
+        print(error_message)
+        return
+
+    # 3. extract response metadata
+    response_text = response["output"]["message"]["content"][0]["text"]
+    _update_observation(
+        output=response_text,
+        usage={
+            "input": response["usage"]["inputTokens"],
+            "output": response["usage"]["outputTokens"],
+            "total": response["usage"]["totalTokens"],
+        },
+        metadata={
+            "ResponseMetadata": response["ResponseMetadata"],
+            **metadata,
+        },
     )
 
+    return response_text
+
+
+@observe(as_type="generation", name="Bedrock Converse Tool Use")
+async def aconverse_tool_use(
+    messages: List[Dict[str, str]],
+    tools: List[Dict[str, str]],
+    tool_choice: str = "auto",
+    model_id: str = "us.amazon.nova-pro-v1:0",
+    prompt: Optional[PromptClient] = None,
+    metadata: Dict[str, Any] = {},
+    **kwargs,
+) -> Optional[List[Dict]]:
+    """Async variant of converse_tool_use."""
+    # 1. extract model metadata
+    _record_request_observation(
+        messages,
+        model_id,
+        prompt,
+        kwargs,
+        extra_input={"tools": tools, "tool_choice": tool_choice},
+    )
+
+    # Convert messages to Bedrock format
+    system_prompts, messages = await aconvert_to_bedrock_messages(messages)
+
+    # 2. Convert tools to Bedrock format
+    tool_config = _tool_config_for(tools, tool_choice)
+
+    # 3. model call with error handling
+    try:
+        _, bedrock = await _get_async_clients()
+        await _BEDROCK_RL.aacquire()
+        response = await bedrock.converse(
+            modelId=model_id,
+            system=system_prompts,
+            messages=messages,
+            toolConfig=tool_config,
+            **kwargs,
+        )
+    except (ClientError, Exception) as e:
+        error_message = f"ERROR: Can't invoke '{model_id}'. Reason: {e}"
+        _update_observation(level="ERROR", status_message=error_message)
+        print(error_message)
+        return
+
+    # 4. Handle tool use flow if needed
+    output_message = response["output"]["message"]
+
+    tool_calls = []
+    if response["stopReason"] == "tool_use":
+        tool_uses = [
+            content["toolUse"]
+            for content in output_message["content"]
+            if "toolUse" in content
+        ]
+        tool_calls = [
+            {
+                "index": index,
+                "id": tool["toolUseId"],
+                "type": "function",
+                "function": {
+                    "name": tool["name"],
+                    "arguments": _json_dumps(tool["input"]),
+                },
+            }
+            for index, tool in enumerate(tool_uses)
+        ]
+
+    # 5. Update Langfuse with response metadata
+    _update_observation(
+        output=tool_calls,
+        usage={
+            "input": response["usage"]["inputTokens"],
+            "output": response["usage"]["outputTokens"],
+            "total": response["usage"]["totalTokens"],
+        },
+        metadata={
+            "ResponseMetadata": response["ResponseMetadata"],
+            **metadata,
+        },
+    )
+
+    return tool_calls
+# endregion
+
+
+@lru_cache(maxsize=1)
+def get_secret():
+
+    secret_name = "LangFuse-LLM-monitoring"
+
     try:
-        get_secret_value_response = client.get_secret_value(
+        get_secret_value_response = _secrets_client.get_secret_value(
             SecretId=secret_name
         )
     except ClientError as e:
@@ -265,5 +843,3 @@ def get_secret():
 
     secret = get_secret_value_response['SecretString']
     return secret
-
-secret=get_secret()